@@ -132,7 +132,7 @@ class Client(t.Generic[AppT], abc.ABC):
     ) -> None:
         self._app = app
         self._default_enabled_guilds = (
-            tuple(hikari.Snowflake(i) for i in default_enabled_guilds)
+            tuple(map(hikari.Snowflake, default_enabled_guilds))
             if default_enabled_guilds is not hikari.UNDEFINED
             else hikari.UNDEFINED
         )
@@ -648,7 +648,7 @@ class Client(t.Generic[AppT], abc.ABC):
             await ctx.respond("Hello!")
         ```
         """
-        guild_ids = tuple(hikari.Snowflake(i) for i in guilds) if guilds is not hikari.UNDEFINED else hikari.UNDEFINED
+        guild_ids = tuple(map(hikari.Snowflake, guilds)) if guilds is not hikari.UNDEFINED else hikari.UNDEFINED
 
         group: SlashGroup[te.Self] = SlashGroup(
             name=name,
@@ -30,11 +30,14 @@ if t.TYPE_CHECKING:
 
     from arc.abc.plugin import PluginBase
     from arc.context.base import Context
+    from arc.locale import LocaleResponse
 
 
 class CommandProto(t.Protocol):
     """A protocol for any command-like object. This includes commands, groups, subgroups, and subcommands."""
 
+    __slots__: t.Sequence[str] = ()
+
     name: str
     """The name of the command."""
     name_localizations: t.Mapping[hikari.Locale, str]
@@ -66,6 +69,8 @@ class CallableCommandProto(CommandProto, t.Protocol[ClientT]):
     This includes commands and subcommands, but not groups or subgroups.
     """
 
+    __slots__: t.Sequence[str] = ()
+
     name: str
     """The name of the command."""
     name_localizations: t.Mapping[hikari.Locale, str]
@@ -259,6 +264,12 @@ class CommandBase(
     _post_hooks: list[PostHookT[ClientT]] = attr.field(init=False, factory=list)
     """The post-execution hooks for this command."""
 
+    _invoke_task: asyncio.Task[t.Any] | None = attr.field(init=False, default=None, repr=False)
+    """The task of the latest invocation of this command, referenced until it finishes."""
+
+    _locale_requested: bool = attr.field(init=False, default=False, repr=False)
+    """Whether the localizations of this command have already been requested from the locale providers."""
+
     @property
     def error_handler(self) -> ErrorHandlerCallbackT[ClientT] | None:
         """The error handler for this command."""
@@ -408,6 +419,11 @@ class CommandBase(
         upstream_hooks = self.plugin._resolve_post_hooks() if self.plugin else self.client._post_hooks
         return upstream_hooks + self._post_hooks
 
+    def _release_invoke_task(self, task: asyncio.Task[t.Any]) -> None:
+        """Drop the reference to a finished invocation task, unless a newer invocation replaced it."""
+        if self._invoke_task is task:
+            self._invoke_task = None
+
     async def publish(self, guild: hikari.SnowflakeishOr[hikari.PartialGuild] | None = None) -> hikari.PartialCommand:
         """Publish this command to the given guild, or globally if no guild is provided.
 
@@ -517,24 +533,36 @@ class CommandBase(
         self._plugin = plugin
         self._plugin._add_command(self)
 
+    def _request_locale_responses(self) -> dict[hikari.Locale, LocaleResponse]:
+        """Request this command's name and description in all provided locales.
+
+        Returns
+        -------
+        dict[hikari.Locale, LocaleResponse]
+            The responses of the command locale provider, keyed by locale.
+            Empty if there is no client, no provided locales, or no command locale provider.
+        """
+        if self._client is None:
+            return {}
+
+        locales, provider = self._client._provided_locales, self._client._command_locale_provider
+
+        if not locales or not provider:
+            return {}
+
+        name = self.name
+        return {locale: provider(CommandLocaleRequest(self, locale, name)) for locale in locales}
+
     def _request_command_locale(self) -> None:
         """Request the locale for this command."""
-        if self.name_localizations or self._client is None:
+        if self._locale_requested or self.name_localizations:
             return
 
-        if not self._client._provided_locales or not self._client._command_locale_provider:
+        if not (responses := self._request_locale_responses()):
             return
 
-        name_locales: dict[hikari.Locale, str] = {}
-
-        for locale in self._client._provided_locales:
-            request = CommandLocaleRequest(self, locale, self.name)
-            resp = self._client._command_locale_provider(request)
-
-            if resp.name is not None:
-                name_locales[locale] = resp.name
-
-        self.name_localizations = name_locales
+        self._locale_requested = True
+        self.name_localizations = {locale: resp.name for locale, resp in responses.items() if resp.name is not None}
 
     async def _handle_pre_hooks(self, command: CallableCommandProto[ClientT], ctx: Context[ClientT]) -> bool:
         """Handle all pre-execution hooks for a command.
@@ -612,8 +640,6 @@ class CallableCommandBase(CommandBase[ClientT, BuilderT], CallableCommandProto[C
     callback: CommandCallbackT[ClientT]
     """The callback to invoke when this command is called."""
 
-    _invoke_task: asyncio.Task[t.Any] | None = attr.field(init=False, default=None, repr=False)
-
     def reset_all_limiters(self, context: Context[ClientT]) -> None:
         """Reset all limiter hooks for this command.
 
@@ -635,9 +661,10 @@ class CallableCommandBase(CommandBase[ClientT, BuilderT], CallableCommandProto[C
         self, interaction: hikari.CommandInteraction, *args: t.Any, **kwargs: t.Any
     ) -> None | asyncio.Future[ResponseBuilderT]:
         ctx = self._get_context(interaction, self)
-        if self.autodefer.should_autodefer:
-            ctx._start_autodefer(self.autodefer)
-        self._invoke_task = asyncio.create_task(self._handle_callback(self, ctx, *args, **kwargs))
+        if (autodefer := self.autodefer).should_autodefer:
+            ctx._start_autodefer(autodefer)
+        self._invoke_task = task = asyncio.create_task(self._handle_callback(self, ctx, *args, **kwargs))
+        task.add_done_callback(self._release_invoke_task)
         if self.client.is_rest:
             return ctx._resp_builder
 
@@ -79,7 +79,7 @@ class PluginBase(HasErrorHandler[ClientT], Hookable[ClientT], HasConcurrencyLimi
         self._client: ClientT | None = None
         self._name = name
         self._default_enabled_guilds = (
-            tuple(hikari.Snowflake(i) for i in default_enabled_guilds)
+            tuple(map(hikari.Snowflake, default_enabled_guilds))
             if default_enabled_guilds is not hikari.UNDEFINED
             else hikari.UNDEFINED
         )
@@ -306,7 +306,7 @@ class PluginBase(HasErrorHandler[ClientT], Hookable[ClientT], HasConcurrencyLimi
             await ctx.respond("Hello!")
         ```
         """
-        guild_ids = tuple(hikari.Snowflake(i) for i in guilds) if guilds is not hikari.UNDEFINED else hikari.UNDEFINED
+        guild_ids = tuple(map(hikari.Snowflake, guilds)) if guilds is not hikari.UNDEFINED else hikari.UNDEFINED
 
         group: SlashGroup[ClientT] = SlashGroup(
             name=name,
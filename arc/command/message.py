@@ -109,7 +109,7 @@ def message_command(
     """
 
     def decorator(callback: MessageCommandCallbackT[ClientT]) -> MessageCommand[ClientT]:
-        guild_ids = tuple(hikari.Snowflake(i) for i in guilds) if guilds is not hikari.UNDEFINED else hikari.UNDEFINED
+        guild_ids = tuple(map(hikari.Snowflake, guilds)) if guilds is not hikari.UNDEFINED else hikari.UNDEFINED
 
         return MessageCommand(
             callback=callback,
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+import operator
+import types
 import typing as t
 
 import attr
@@ -10,10 +12,18 @@ from arc.abc.command import CallableCommandBase, CallableCommandProto, CommandBa
 from arc.abc.option import OptionType, OptionWithChoices
 from arc.context import AutocompleteData, AutodeferMode, Context
 from arc.errors import AutocompleteError, CommandInvokeError
-from arc.internal.options import resolve_options
+from arc.internal.options import make_option_resolver
 from arc.internal.sigparse import parse_command_signature
-from arc.internal.types import ClientT, CommandCallbackT, HookT, PostHookT, ResponseBuilderT, SlashCommandLike
-from arc.locale import CommandLocaleRequest, LocaleResponse
+from arc.internal.types import (
+    ClientT,
+    CommandCallbackT,
+    HookT,
+    InteractionOptionT,
+    OptionT,
+    PostHookT,
+    ResponseBuilderT,
+    SlashCommandLike,
+)
 
 if t.TYPE_CHECKING:
     from asyncio.futures import Future
@@ -23,6 +33,7 @@ if t.TYPE_CHECKING:
     from arc.abc.concurrency_limiting import ConcurrencyLimiterProto
     from arc.abc.option import CommandOptionBase
     from arc.abc.plugin import PluginBase
+    from arc.internal.options import OptionResolverT
 
 __all__ = (
     "SlashCommandLike",
@@ -39,17 +50,70 @@ def _choices_to_builders(
     choices: t.Sequence[hikari.api.AutocompleteChoiceBuilder] | t.Sequence[t.Any] | t.Mapping[str, t.Any],
 ) -> t.Sequence[hikari.api.AutocompleteChoiceBuilder]:
     """Convert a sequence of choices to a sequence of choice builders."""
+    builder = hikari.impl.AutocompleteChoiceBuilder
+
     if isinstance(choices, t.Mapping):
-        return [hikari.impl.AutocompleteChoiceBuilder(str(k), v) for k, v in choices.items()]
+        return [builder(str(k), v) for k, v in choices.items()]
 
-    return [
-        (
-            hikari.impl.AutocompleteChoiceBuilder(str(e), e)
-            if not isinstance(e, hikari.api.AutocompleteChoiceBuilder)
-            else e
-        )
-        for e in choices
-    ]
+    if not choices:
+        return []
+
+    # Choices are expected to be homogenous, so only the first element needs to be checked
+    if isinstance(choices[0], hikari.api.AutocompleteChoiceBuilder):
+        return choices if isinstance(choices, list) else list(choices)
+
+    return [builder(str(e), e) for e in t.cast(t.Sequence[t.Any], choices)]
+
+
+def _sort_options(options: t.Mapping[str, OptionT]) -> tuple[OptionT, ...]:
+    """Sort options so that required options come first, as Discord requires."""
+    return tuple(sorted(options.values(), key=operator.attrgetter("is_required"), reverse=True))
+
+
+def _freeze_options(options: t.Mapping[str, OptionT]) -> t.Mapping[str, OptionT]:
+    """Copy options into a read-only mapping, the option resolver of a command is built from them once."""
+    return types.MappingProxyType(dict(options))
+
+
+def _make_autocomplete_data(
+    client: ClientT,
+    command: CommandProto,
+    interaction: hikari.AutocompleteInteraction,
+    options: t.Sequence[hikari.AutocompleteInteractionOption],
+    focused_option: hikari.AutocompleteInteractionOption,
+) -> AutocompleteData[ClientT, t.Any]:
+    """Create the data passed to an autocomplete callback, with the focused option found while routing."""
+    data: AutocompleteData[ClientT, t.Any] = AutocompleteData(
+        interaction=interaction, options=options, client=client, command=command
+    )
+    data._focused_option = focused_option
+    return data
+
+
+def _find_child_option(
+    options: t.Sequence[InteractionOptionT], children: t.Mapping[str, t.Any]
+) -> InteractionOptionT | None:
+    """Find the option that refers to a child of a group.
+
+    Discord only sends a single option for the invoked subcommand or subgroup, so that is checked without a scan.
+    """
+    if len(options) == 1:
+        return options[0] if options[0].name in children else None
+
+    for option in options:
+        if option.name in children:
+            return option
+    return None
+
+
+def _find_focused_option(
+    options: t.Sequence[hikari.AutocompleteInteractionOption], local_options: t.Mapping[str, t.Any]
+) -> hikari.AutocompleteInteractionOption | None:
+    """Find the focused option that is also a known local option in a single pass."""
+    for option in options:
+        if option.is_focused and option.name in local_options:
+            return option
+    return None
 
 
 @attr.define(slots=True, kw_only=True)
@@ -62,8 +126,19 @@ class SlashCommand(CallableCommandBase[ClientT, hikari.api.SlashCommandBuilder])
     description_localizations: t.Mapping[hikari.Locale, str] = attr.field(factory=dict)
     """The localizations for this command's description."""
 
-    options: dict[str, CommandOptionBase[t.Any, ClientT, t.Any]] = attr.field(factory=dict)
-    """The options of this slash command."""
+    options: t.Mapping[str, CommandOptionBase[t.Any, ClientT, t.Any]] = attr.field(
+        factory=dict, converter=_freeze_options
+    )
+    """The options of this slash command.
+
+    This mapping is read-only, the options of a command are fixed once it is constructed.
+    """
+
+    _option_resolver: OptionResolverT = attr.field(init=False, repr=False)
+    """The resolver specialized for the options of this command."""
+
+    def __attrs_post_init__(self) -> None:
+        self._option_resolver = make_option_resolver(self.options)
 
     @property
     def command_type(self) -> hikari.CommandType:
@@ -90,15 +165,18 @@ class SlashCommand(CallableCommandBase[ClientT, hikari.api.SlashCommandBuilder])
         ctx._options = interaction.options
         return ctx
 
+    def _get_command_options(self) -> list[hikari.CommandOption]:
+        """Get the options of this command as hikari command options, required options first."""
+        return [option.to_command_option() for option in _sort_options(self.options)]
+
     def _to_dict(self) -> dict[str, t.Any]:
-        sorted_options = sorted(self.options.values(), key=lambda option: option.is_required, reverse=True)
         payload = {
             **super()._to_dict(),
             "description": self.description,
             "description_localizations": self.description_localizations,
         }
-        if sorted_options:
-            payload["options"] = [option.to_command_option() for option in sorted_options]
+        if command_options := self._get_command_options():
+            payload["options"] = command_options
         return payload
 
     def _build(self, id: hikari.Snowflake | hikari.UndefinedType = hikari.UNDEFINED) -> hikari.api.SlashCommandBuilder:
@@ -106,7 +184,7 @@ class SlashCommand(CallableCommandBase[ClientT, hikari.api.SlashCommandBuilder])
             name=self.name,
             description=self.description,
             id=id,
-            options=[option.to_command_option() for option in self.options.values()],
+            options=self._get_command_options(),
             default_member_permissions=self.default_permissions,
             is_dm_enabled=self.is_dm_enabled,
             is_nsfw=self.is_nsfw,
@@ -117,14 +195,10 @@ class SlashCommand(CallableCommandBase[ClientT, hikari.api.SlashCommandBuilder])
     async def invoke(
         self, interaction: hikari.CommandInteraction, *args: t.Any, **kwargs: t.Any
     ) -> Future[ResponseBuilderT] | None:
-        if interaction.options:
-            return await super().invoke(
-                interaction,
-                *args,
-                **{**kwargs, **resolve_options(self.options, interaction.options, interaction.resolved)},
-            )
-        else:
-            return await super().invoke(interaction, *args, **kwargs)
+        if options := interaction.options:
+            kwargs.update(self._option_resolver(options, interaction.resolved))
+
+        return await super().invoke(interaction, *args, **kwargs)
 
     def make_mention(self, *, guild: hikari.Snowflakeish | hikari.PartialGuild | None = None) -> str:
         """Make a slash mention for this command.
@@ -144,7 +218,8 @@ class SlashCommand(CallableCommandBase[ClientT, hikari.api.SlashCommandBuilder])
         KeyError
             If the command has not been published in the given guild or globally.
         """
-        instance = self._instances.get(hikari.Snowflake(guild) if guild else None)
+        key = guild if guild is None or isinstance(guild, hikari.Snowflake) else hikari.Snowflake(guild)
+        instance = self._instances.get(key)
 
         if instance is None:
             raise KeyError(f"Command '{self.display_name}' has not been published in the given scope.")
@@ -154,49 +229,48 @@ class SlashCommand(CallableCommandBase[ClientT, hikari.api.SlashCommandBuilder])
     async def _on_autocomplete(
         self, interaction: hikari.AutocompleteInteraction
     ) -> hikari.api.InteractionAutocompleteBuilder | None:
-        opt = next((o for o in interaction.options if o.name in self.options and o.is_focused), None)
+        options = interaction.options
+        local_options = self.options
+        opt = _find_focused_option(options, local_options)
 
         if opt is None:
-            raise ValueError(f"Slash command got unknown option to autocomplete: '{interaction.options[0]}'.")
+            raise ValueError(f"Slash command got unknown option to autocomplete: '{options[0].name}'.")
 
-        local_opt = self.options[opt.name]
+        local_opt = local_options[opt.name]
 
         if not isinstance(local_opt, OptionWithChoices) or not local_opt.autocomplete_with:
             raise ValueError(
                 f"Slash option got autocomplete interaction without autocomplete callback: '{local_opt.name}'."
             )
 
+        client = self.client
+
         choices = _choices_to_builders(
-            await self.client.injector.call_with_async_di(
+            await client.injector.call_with_async_di(
                 local_opt.autocomplete_with,  # pyright: ignore reportGeneralTypeIssues
-                AutocompleteData(
-                    interaction=interaction, options=interaction.options, client=self.client, command=self
-                ),
+                _make_autocomplete_data(client, self, interaction, options, opt),
             )
         )
 
-        if self.client.is_rest:
+        if client.is_rest:
             return interaction.build_response(choices)
 
         await interaction.create_response(choices)
 
     def _request_command_locale(self) -> None:
         """Request the locale for this command."""
-        if self.name_localizations or self.description_localizations or self._client is None:
+        if self._locale_requested or self.name_localizations or self.description_localizations:
             return
 
-        if not self._client._provided_locales or not self._client._command_locale_provider:
+        if not (responses := self._request_locale_responses()):
             return
 
+        self._locale_requested = True
+
         name_locales: dict[hikari.Locale, str] = {}
         desc_locales: dict[hikari.Locale, str] = {}
 
-        for locale in self._client._provided_locales:
-            request = CommandLocaleRequest(self, locale, self.name)
-            resp = self._client._command_locale_provider(request)
-
-            assert isinstance(resp, LocaleResponse)
-
+        for locale, resp in responses.items():
             if resp.name is not None and resp.description is not None:
                 name_locales[locale] = resp.name
                 desc_locales[locale] = resp.description
@@ -205,7 +279,7 @@ class SlashCommand(CallableCommandBase[ClientT, hikari.api.SlashCommandBuilder])
         self.description_localizations: t.Mapping[hikari.Locale, str] = desc_locales
 
         for option in self.options.values():
-            option._request_option_locale(self._client, self)
+            option._request_option_locale(self.client, self)
 
 
 @attr.define(slots=True, kw_only=True)
@@ -221,8 +295,6 @@ class SlashGroup(CommandBase[ClientT, hikari.api.SlashCommandBuilder]):
     description_localizations: t.Mapping[hikari.Locale, str] = attr.field(factory=dict)
     """The localizations for this group's description."""
 
-    _invoke_task: asyncio.Task[t.Any] | None = attr.field(init=False, default=None)
-
     @property
     def command_type(self) -> hikari.CommandType:
         return hikari.CommandType.SLASH
@@ -236,14 +308,18 @@ class SlashGroup(CommandBase[ClientT, hikari.api.SlashCommandBuilder]):
         """The display name of this command."""
         return f"/{self.name}"
 
+    def _get_command_options(self) -> list[hikari.CommandOption]:
+        """Get the children of this group as hikari command options."""
+        return [subcmd.to_command_option() for subcmd in self.children.values()]
+
     def _to_dict(self) -> dict[str, t.Any]:
         payload = {
             **super()._to_dict(),
             "description": self.description,
             "description_localizations": self.description_localizations,
         }
-        if self.children:
-            payload["options"] = [subcmd.to_command_option() for subcmd in self.children.values()]
+        if command_options := self._get_command_options():
+            payload["options"] = command_options
         return payload
 
     def _get_context(
@@ -261,7 +337,7 @@ class SlashGroup(CommandBase[ClientT, hikari.api.SlashCommandBuilder]):
             name=self.name,
             description=self.description,
             id=id,
-            options=[subcmd.to_command_option() for subcmd in self.children.values()],
+            options=self._get_command_options(),
             default_member_permissions=self.default_permissions,
             is_dm_enabled=self.is_dm_enabled,
             is_nsfw=self.is_nsfw,
@@ -281,120 +357,140 @@ class SlashGroup(CommandBase[ClientT, hikari.api.SlashCommandBuilder]):
         ctx = self._get_context(interaction, subcommand)
         ctx._options = options
 
-        if (autodefer := subcommand.autodefer) and autodefer.should_autodefer:
+        if (autodefer := subcommand.autodefer).should_autodefer:
             ctx._start_autodefer(autodefer)
 
-        self._invoke_task = asyncio.create_task(self._handle_callback(subcommand, ctx, *args, **kwargs))
+        self._invoke_task = task = asyncio.create_task(self._handle_callback(subcommand, ctx, *args, **kwargs))
+        task.add_done_callback(self._release_invoke_task)
         if self.client.is_rest:
             return ctx._resp_builder
 
-    async def invoke(
-        self, interaction: hikari.CommandInteraction, *args: t.Any, **kwargs: t.Any
-    ) -> Future[ResponseBuilderT] | None:
-        if interaction.options is None:
-            raise CommandInvokeError("Cannot invoke slash group with empty options.")
+    def _resolve_subcommand(
+        self, options: t.Sequence[InteractionOptionT], error: type[Exception]
+    ) -> tuple[SlashSubCommand[ClientT], t.Sequence[InteractionOptionT] | None]:
+        """Walk the options of an interaction down to the subcommand it targets.
 
-        # Get first-order subcommand
-        sub = next((o for o in interaction.options if o.name in self.children), None)
+        Parameters
+        ----------
+        options : t.Sequence[InteractionOptionT]
+            The top-level options of the interaction.
+        error : type[Exception]
+            The exception type to raise if the options do not point to a known subcommand.
 
-        if sub is None:
-            raise CommandInvokeError(f"Slash group got unknown subcommand: '{interaction.options[0]}'.")
+        Returns
+        -------
+        tuple[SlashSubCommand[ClientT], t.Sequence[InteractionOptionT] | None]
+            The targeted subcommand and the options that were passed to it.
+        """
+        children = self.children
 
-        subcmd = self.children[sub.name]
+        # First-order subcommand or subgroup
+        sub = _find_child_option(options, children)
 
-        # Invoke it if it has no options
-        if sub.options is None:
-            if not isinstance(subcmd, SlashSubCommand):
-                raise CommandInvokeError(f"Slash group got subgroup without options: '{subcmd.name}'.")
-            return await self._invoke_subcmd(subcmd, interaction, None, *args, **kwargs)
+        if sub is None:
+            raise error(f"Slash group got unknown subcommand: '{options[0].name}'.")
+
+        subcmd = children[sub.name]
 
-        # Resolve options and invoke if it does
         if isinstance(subcmd, SlashSubCommand):
-            res = resolve_options(subcmd.options, sub.options, interaction.resolved)
-            return await self._invoke_subcmd(subcmd, interaction, sub.options, *args, **{**kwargs, **res})
+            return subcmd, sub.options
+
+        sub_options = sub.options
 
-        # Get second-order subcommand
-        subsub = next((o for o in sub.options if o.name in subcmd.children), None)
+        if sub_options is None:
+            raise error(f"Slash group got subgroup without options: '{subcmd.name}'.")
+
+        # Second-order subcommand
+        subsub = _find_child_option(sub_options, subcmd.children)
 
         if subsub is None:
-            raise CommandInvokeError(f"Slash group got unknown subcommand: '{sub.options[0]}'.")
+            raise error(f"Slash subgroup got unknown subcommand: '{sub_options[0].name}'.")
+
+        return subcmd.children[subsub.name], subsub.options
+
+    async def invoke(
+        self, interaction: hikari.CommandInteraction, *args: t.Any, **kwargs: t.Any
+    ) -> Future[ResponseBuilderT] | None:
+        options = interaction.options
+
+        if options is None:
+            raise CommandInvokeError("Cannot invoke slash group with empty options.")
 
-        subsubcmd = subcmd.children[subsub.name]
+        subcmd, sub_options = self._resolve_subcommand(options, CommandInvokeError)
 
-        # Invoke it if it has no options
-        if subsub.options is None:
-            return await self._invoke_subcmd(subsubcmd, interaction, None, *args, **kwargs)
+        if sub_options:
+            kwargs.update(subcmd._option_resolver(sub_options, interaction.resolved))
 
-        # Resolve options and invoke if it does
-        res = resolve_options(subsubcmd.options, subsub.options, interaction.resolved)
-        return await self._invoke_subcmd(subsubcmd, interaction, subsub.options, *args, **{**kwargs, **res})
+        return await self._invoke_subcmd(subcmd, interaction, sub_options, *args, **kwargs)
 
     async def _on_autocomplete(
         self, interaction: hikari.AutocompleteInteraction
     ) -> hikari.api.InteractionAutocompleteBuilder | None:
-        # First-order subcommand
-        sub = next((o for o in interaction.options if o.name in self.children), None)
+        subcmd, opts = self._resolve_subcommand(interaction.options, AutocompleteError)
 
-        if sub is None:
-            raise AutocompleteError(f"Slash group got unknown subcommand to autocomplete: '{interaction.options[0]}'.")
-
-        subcmd = self.children[sub.name]
-
-        if sub.options is None:
+        if opts is None:
             raise AutocompleteError(f"Slash group got subcommand without options: '{subcmd.name}'.")
 
-        # If it is a first-order subcommand, get the option
-        if isinstance(subcmd, SlashSubCommand):
-            opts = sub.options
-            opt = next(o for o in sub.options if o.name in subcmd.options and o.is_focused)
-            local_opt = subcmd.options[opt.name]
-        else:
-            # Otherwise continue the conga-line
-            subsub = next((o for o in sub.options if o.name in subcmd.children), None)
-
-            if subsub is None:
-                raise AutocompleteError(f"Slash subgroup got unknown subcommand to autocomplete: '{sub.options[0]}'.")
+        local_opts = subcmd.options
+        opt = _find_focused_option(opts, local_opts)
 
-            if subsub.options is None:
-                raise AutocompleteError(f"Slash subgroup got subcommand without options: '{subsub.name}'.")
+        if opt is None:
+            raise AutocompleteError(f"Slash group got unknown option to autocomplete: '{opts[0].name}'.")
 
-            subsubcmd = subcmd.children[subsub.name]
-            opts = subsub.options
-            opt = next(o for o in subsub.options if o.name in subsubcmd.options and o.is_focused)
-            local_opt = subsubcmd.options[opt.name]
+        local_opt = local_opts[opt.name]
 
         if not isinstance(local_opt, OptionWithChoices) or not local_opt.autocomplete_with:
             raise AutocompleteError(
                 f"Slash option got autocomplete interaction without autocomplete callback: '{local_opt.name}'."
             )
 
+        client = self.client
+
         choices = _choices_to_builders(
-            await self.client.injector.call_with_async_di(
+            await client.injector.call_with_async_di(
                 local_opt.autocomplete_with,  # pyright: ignore reportGeneralTypeIssues
-                AutocompleteData(interaction=interaction, options=opts, client=self.client, command=self),
+                _make_autocomplete_data(client, self, interaction, opts, opt),
             )
         )
 
-        if self.client.is_rest:
+        if client.is_rest:
             return interaction.build_response(choices)
 
         await interaction.create_response(choices)
 
+    def _set_client(self, client: ClientT | None) -> None:
+        """Set the client of this group and propagate it to all children."""
+        self._client = client
+
+        for child in self.children.values():
+            child._client = client
+
+            if isinstance(child, SlashSubGroup):
+                for subcommand in child.children.values():
+                    subcommand._client = client
+
+    def _client_include_hook(self, client: ClientT) -> None:
+        self._set_client(client)
+        self.client._add_command(self)
+
+    def _client_remove_hook(self, client: ClientT) -> None:
+        self.client._remove_command(self)
+        self._set_client(None)
+
     def _request_command_locale(self) -> None:
         """Request the locale for this command."""
-        if self.name_localizations or self.description_localizations or self._client is None:
+        if self._locale_requested or self.name_localizations or self.description_localizations:
             return
 
-        if not self._client._provided_locales or not self._client._command_locale_provider:
+        if not (responses := self._request_locale_responses()):
             return
 
+        self._locale_requested = True
+
         name_locales: dict[hikari.Locale, str] = {}
         desc_locales: dict[hikari.Locale, str] = {}
 
-        for locale in self._client._provided_locales:
-            request = CommandLocaleRequest(self, locale, self.name)
-            resp = self._client._command_locale_provider(request)
-
+        for locale, resp in responses.items():
             if resp.name is not None and resp.description is not None:
                 name_locales[locale] = resp.name
                 desc_locales[locale] = resp.description
@@ -403,7 +499,7 @@ class SlashGroup(CommandBase[ClientT, hikari.api.SlashCommandBuilder]):
         self.description_localizations: t.Mapping[hikari.Locale, str] = desc_locales
 
         for sub in self.children.values():
-            sub._request_option_locale(self._client, self)
+            sub._request_option_locale(self.client, self)
 
     @t.overload
     def include(self) -> t.Callable[[SlashSubCommand[ClientT]], SlashSubCommand[ClientT]]: ...
@@ -417,7 +513,7 @@ class SlashGroup(CommandBase[ClientT, hikari.api.SlashCommandBuilder]):
         """Decorator to add a subcommand to this group."""
 
         def decorator(command: SlashSubCommand[ClientT]) -> SlashSubCommand[ClientT]:
-            command._parent = self
+            command._set_parent(self)
             self.children[command.name] = command
             return command
 
@@ -458,7 +554,7 @@ class SlashGroup(CommandBase[ClientT, hikari.api.SlashCommandBuilder]):
             name_localizations=name_localizations or {},
             description_localizations=description_localizations or {},
         )
-        group._parent = self
+        group._set_parent(self)
         self.children[name] = group
         return group
 
@@ -470,11 +566,23 @@ class SlashSubGroup(SubCommandBase[ClientT, SlashGroup[ClientT]]):
     children: dict[str, SlashSubCommand[ClientT]] = attr.field(factory=dict, init=False)
     """Subcommands that belong to this subgroup."""
 
+    _client: ClientT | None = attr.field(init=False, default=None, repr=False)
+    """The client of the root group, propagated when the subgroup is included."""
+
     _autodefer: AutodeferMode | hikari.UndefinedType = attr.field(default=hikari.UNDEFINED, alias="autodefer")
     """If True, this subcommand will automatically defer if it is taking longer than 2 seconds to respond.
     If undefined, then it will be inherited from the parent.
     """
 
+    _qualified_name: tuple[str, str] | None = attr.field(default=None, init=False, repr=False)
+    """The qualified name of this subgroup, cached when the parent is set."""
+
+    def _set_parent(self, parent: SlashGroup[ClientT]) -> None:
+        """Set the parent of this subgroup and cache everything derived from it."""
+        self._parent = parent
+        self._client = parent._client
+        self._qualified_name = (parent.name, self.name)
+
     @property
     def option_type(self) -> OptionType:
         return OptionType.SUB_COMMAND_GROUP
@@ -485,6 +593,9 @@ class SlashSubGroup(SubCommandBase[ClientT, SlashGroup[ClientT]]):
 
     @property
     def qualified_name(self) -> t.Sequence[str]:
+        if self._qualified_name is not None:
+            return self._qualified_name
+
         return (self.parent.name, self.name)
 
     @property
@@ -494,6 +605,9 @@ class SlashSubGroup(SubCommandBase[ClientT, SlashGroup[ClientT]]):
     @property
     def client(self) -> ClientT:
         """The client that includes this subgroup."""
+        if self._client is not None:
+            return self._client
+
         return self.parent.client
 
     @property
@@ -517,6 +631,10 @@ class SlashSubGroup(SubCommandBase[ClientT, SlashGroup[ClientT]]):
     def _resolve_settings(self) -> _CommandSettings:
         settings = self._parent._resolve_settings() if self._parent else _CommandSettings.default()
 
+        # Subcommands and subgroups can only override autodefer, the parent's settings are already a fresh copy
+        if self._autodefer is hikari.UNDEFINED:
+            return settings
+
         return settings.apply(
             _CommandSettings(
                 autodefer=self._autodefer,
@@ -527,16 +645,18 @@ class SlashSubGroup(SubCommandBase[ClientT, SlashGroup[ClientT]]):
         )
 
     def _resolve_hooks(self) -> list[HookT[ClientT]]:
-        assert self._parent is not None
-        return self._parent._resolve_hooks() + self._hooks
+        # The parent always returns a fresh list, so it is safe to extend it in place
+        hooks = self.parent._resolve_hooks()
+        hooks.extend(self._hooks)
+        return hooks
 
     def _resolve_post_hooks(self) -> list[PostHookT[ClientT]]:
-        assert self._parent is not None
-        return self._parent._resolve_post_hooks() + self._post_hooks
+        post_hooks = self.parent._resolve_post_hooks()
+        post_hooks.extend(self._post_hooks)
+        return post_hooks
 
     def _resolve_concurrency_limiter(self) -> ConcurrencyLimiterProto[ClientT] | None:
-        assert self._parent is not None
-        return self._parent._resolve_concurrency_limiter()
+        return self.parent._resolve_concurrency_limiter()
 
     async def _handle_exception(self, ctx: Context[ClientT], exc: Exception) -> None:
         try:
@@ -545,8 +665,7 @@ class SlashSubGroup(SubCommandBase[ClientT, SlashGroup[ClientT]]):
             else:
                 raise exc
         except Exception as exc:
-            assert self._parent is not None
-            await self._parent._handle_exception(ctx, exc)
+            await self.parent._handle_exception(ctx, exc)
 
     def _request_option_locale(self, client: Client[t.Any], command: CommandProto) -> None:
         super()._request_option_locale(client, command)
@@ -566,7 +685,7 @@ class SlashSubGroup(SubCommandBase[ClientT, SlashGroup[ClientT]]):
         """First-order decorator to add a subcommand to this group."""
 
         def decorator(command: SlashSubCommand[ClientT]) -> SlashSubCommand[ClientT]:
-            command._parent = self
+            command._set_parent(self)
             self.children[command.name] = command
             return command
 
@@ -585,8 +704,19 @@ class SlashSubCommand(
     callback: CommandCallbackT[ClientT]
     """The callback that will be invoked when this subcommand is invoked."""
 
-    options: t.MutableMapping[str, CommandOptionBase[ClientT, t.Any, t.Any]] = attr.field(factory=dict)
-    """The options of this subcommand."""
+    options: t.Mapping[str, CommandOptionBase[ClientT, t.Any, t.Any]] = attr.field(
+        factory=dict, converter=_freeze_options
+    )
+    """The options of this subcommand.
+
+    This mapping is read-only, the options of a subcommand are fixed once it is constructed.
+    """
+
+    _option_resolver: OptionResolverT = attr.field(init=False, repr=False)
+    """The resolver specialized for the options of this command."""
+
+    _client: ClientT | None = attr.field(init=False, default=None, repr=False)
+    """The client of the root group, propagated when the subcommand is included."""
 
     _autodefer: AutodeferMode | hikari.UndefinedType = attr.field(default=hikari.UNDEFINED, alias="autodefer")
     """If True, this subcommand will automatically defer if it is taking longer than 2 seconds to respond.
@@ -595,9 +725,28 @@ class SlashSubCommand(
 
     _invoke_task: asyncio.Task[t.Any] | None = attr.field(default=None, init=False)
 
+    _root: SlashGroup[ClientT] | None = attr.field(default=None, init=False, repr=False)
+    """The root group of this subcommand, cached when the parent is set."""
+
+    _qualified_name: tuple[str, ...] | None = attr.field(default=None, init=False, repr=False)
+    """The qualified name of this subcommand, cached when the parent is set."""
+
+    def __attrs_post_init__(self) -> None:
+        self._option_resolver = make_option_resolver(self.options)
+
+    def _set_parent(self, parent: SlashGroup[ClientT] | SlashSubGroup[ClientT]) -> None:
+        """Set the parent of this subcommand and cache everything derived from it."""
+        self._parent = parent
+        self._client = parent._client
+        self._root = parent if isinstance(parent, SlashGroup) else parent._parent
+        self._qualified_name = (*parent.qualified_name, self.name) if self._root is not None else None
+
     @property
     def root(self) -> SlashGroup[ClientT]:
         """The root group of this subcommand."""
+        if self._root is not None:
+            return self._root
+
         if self._parent is None:
             raise ValueError("Cannot get root of subcommand without parent.")
 
@@ -611,6 +760,9 @@ class SlashSubCommand(
 
     @property
     def qualified_name(self) -> t.Sequence[str]:
+        if self._qualified_name is not None:
+            return self._qualified_name
+
         if isinstance(self._parent, SlashSubGroup):
             return (self.root.name, self.parent.name, self.name)
 
@@ -634,6 +786,9 @@ class SlashSubCommand(
     @property
     def client(self) -> ClientT:
         """The client that includes this subcommand."""
+        if self._client is not None:
+            return self._client
+
         return self.root.client
 
     @property
@@ -660,7 +815,8 @@ class SlashSubCommand(
         str
             The slash command mention.
         """
-        instance = self.root._instances.get(hikari.Snowflake(guild) if guild else None)
+        key = guild if guild is None or isinstance(guild, hikari.Snowflake) else hikari.Snowflake(guild)
+        instance = self.root._instances.get(key)
 
         if instance is None:
             raise KeyError(f"Command '{self.display_name}' has not been published in the given scope.")
@@ -670,6 +826,9 @@ class SlashSubCommand(
     def _resolve_settings(self) -> _CommandSettings:
         settings = self._parent._resolve_settings() if self._parent else _CommandSettings.default()
 
+        if self._autodefer is hikari.UNDEFINED:
+            return settings
+
         return settings.apply(
             _CommandSettings(
                 autodefer=self._autodefer,
@@ -680,16 +839,18 @@ class SlashSubCommand(
         )
 
     def _resolve_hooks(self) -> list[HookT[ClientT]]:
-        assert self._parent is not None
-        return self._parent._resolve_hooks() + self._hooks
+        # The parent always returns a fresh list, so it is safe to extend it in place
+        hooks = self.parent._resolve_hooks()
+        hooks.extend(self._hooks)
+        return hooks
 
     def _resolve_post_hooks(self) -> list[PostHookT[ClientT]]:
-        assert self._parent is not None
-        return self._parent._resolve_post_hooks() + self._post_hooks
+        post_hooks = self.parent._resolve_post_hooks()
+        post_hooks.extend(self._post_hooks)
+        return post_hooks
 
     def _resolve_concurrency_limiter(self) -> ConcurrencyLimiterProto[ClientT] | None:
-        assert self._parent is not None
-        return self._parent._resolve_concurrency_limiter()
+        return self.parent._resolve_concurrency_limiter()
 
     async def _handle_exception(self, ctx: Context[ClientT], exc: Exception) -> None:
         try:
@@ -698,8 +859,7 @@ class SlashSubCommand(
             else:
                 raise exc
         except Exception as e:
-            assert self._parent is not None
-            await self._parent._handle_exception(ctx, e)
+            await self.parent._handle_exception(ctx, e)
 
     def _request_option_locale(self, client: Client[t.Any], command: CommandProto) -> None:
         super()._request_option_locale(client, command)
@@ -728,9 +888,8 @@ class SlashSubCommand(
 
     def _to_dict(self) -> dict[str, t.Any]:
         payload = super()._to_dict()
-        sorted_options = sorted(self.options.values(), key=lambda option: option.is_required, reverse=True)
-        if sorted_options:
-            payload["options"] = [option.to_command_option() for option in sorted_options]
+        if self.options:
+            payload["options"] = [option.to_command_option() for option in _sort_options(self.options)]
         return payload
 
 
@@ -791,7 +950,7 @@ def slash_command(
     """
 
     def decorator(func: CommandCallbackT[ClientT]) -> SlashCommand[ClientT]:
-        guild_ids = tuple(hikari.Snowflake(i) for i in guilds) if guilds is not hikari.UNDEFINED else hikari.UNDEFINED
+        guild_ids = tuple(map(hikari.Snowflake, guilds)) if guilds is not hikari.UNDEFINED else hikari.UNDEFINED
         options = parse_command_signature(func)
 
         return SlashCommand(
@@ -59,9 +59,11 @@ class UserCommand(CallableCommandBase[ClientT, hikari.api.ContextMenuCommandBuil
 
         assert interaction.resolved is not None and interaction.target_id is not None
 
-        user = (
-            interaction.resolved.members.get(interaction.target_id) or interaction.resolved.users[interaction.target_id]
-        )
+        resolved, target_id = interaction.resolved, interaction.target_id
+        user = resolved.members.get(target_id)
+
+        if user is None:
+            user = resolved.users[target_id]
 
         return await super().invoke(interaction, user, *args, **kwargs)
 
@@ -110,7 +112,7 @@ def user_command(
     """
 
     def decorator(callback: UserCommandCallbackT[ClientT]) -> UserCommand[ClientT]:
-        guild_ids = tuple(hikari.Snowflake(i) for i in guilds) if guilds is not hikari.UNDEFINED else hikari.UNDEFINED
+        guild_ids = tuple(map(hikari.Snowflake, guilds)) if guilds is not hikari.UNDEFINED else hikari.UNDEFINED
 
         return UserCommand(
             callback=callback,
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import typing as t
-from functools import cached_property
 
 import attr
 
@@ -15,9 +14,8 @@ if t.TYPE_CHECKING:
 __all__ = ("AutocompleteData",)
 
 
-# Don't slot, because we want to use cached_property.
 @t.final
-@attr.define(slots=False, kw_only=True)
+@attr.define(slots=True, kw_only=True)
 class AutocompleteData(t.Generic[ClientT, ChoiceT]):
     """The data that is provided to an autocomplete callback."""
 
@@ -33,12 +31,22 @@ class AutocompleteData(t.Generic[ClientT, ChoiceT]):
     options: t.Sequence[hikari.AutocompleteInteractionOption]
     """The options that have been provided so far."""
 
-    @cached_property
+    _focused_option: hikari.AutocompleteInteractionOption | None = attr.field(default=None, init=False, repr=False)
+    """The focused option, found either by the command while routing the interaction or on first access."""
+
+    @property
     def focused_option(self) -> hikari.AutocompleteInteractionOption | None:
         """The option that is currently being focused."""
-        return next((o for o in self.options if o.is_focused), None)
+        if self._focused_option is not None:
+            return self._focused_option
 
-    @cached_property
+        for option in self.options:
+            if option.is_focused:
+                self._focused_option = option
+                return option
+        return None
+
+    @property
     def focused_value(self) -> ChoiceT | str | None:
         """The value that is currently being focused. This property will return `None` if there is no focused option.
 
@@ -49,9 +57,9 @@ class AutocompleteData(t.Generic[ClientT, ChoiceT]):
             According to some testing, this option is always either `None` or a string, however
             the API documentation says that it can be the option type as well.
         """
-        if self.focused_option is None:
+        if (focused := self.focused_option) is None:
             return None
-        return t.cast(ChoiceT | str, self.focused_option.value)
+        return t.cast(ChoiceT | str, focused.value)
 
     @property
     def guild_id(self) -> hikari.Snowflake | None:
@@ -4,6 +4,7 @@ import asyncio
 import datetime
 import enum
 import logging
+import time
 import typing as t
 from contextlib import suppress
 
@@ -49,7 +50,7 @@ class AutodeferMode(enum.IntEnum):
 
 @attr.define(slots=True)
 class _ResponseGlue:
-    """A glue object to allow for easy creation of responses in both REST and Gateway contexts."""
+    """A glue object to turn the arguments of an initial response into a builder in REST contexts."""
 
     content: t.Any | hikari.UndefinedType = hikari.UNDEFINED
     flags: int | hikari.MessageFlag | hikari.UndefinedType = hikari.UNDEFINED
@@ -64,34 +65,25 @@ class _ResponseGlue:
     user_mentions: t.Sequence[hikari.Snowflakeish | hikari.PartialUser] | bool | hikari.UndefinedType = hikari.UNDEFINED
     role_mentions: t.Sequence[hikari.Snowflakeish | hikari.PartialRole] | bool | hikari.UndefinedType = hikari.UNDEFINED
 
-    def _to_dict(self) -> dict[str, t.Any]:
-        return {
-            "content": self.content,
-            "flags": self.flags,
-            "tts": self.tts,
-            "component": self.component,
-            "components": self.components,
-            "attachment": self.attachment,
-            "attachments": self.attachments,
-            "embed": self.embed,
-            "embeds": self.embeds,
-            "mentions_everyone": self.mentions_everyone,
-            "user_mentions": self.user_mentions,
-            "role_mentions": self.role_mentions,
-        }
-
     def _to_builder(self) -> hikari.api.InteractionMessageBuilder:
-        components: list[hikari.api.ComponentBuilder] = list(self.components) if self.components else []
-        attachments: list[hikari.Resourceish] = list(self.attachments) if self.attachments else []
-        embeds: list[hikari.Embed] = list(self.embeds) if self.embeds else []
+        # The sequence takes precedence over the singular variant, lists are only built for whichever is set
+        components: list[hikari.api.ComponentBuilder] | hikari.UndefinedType = (
+            list(self.components) if self.components else [self.component] if self.component else hikari.UNDEFINED
+        )
+        attachments: list[hikari.Resourceish] | hikari.UndefinedType = (
+            list(self.attachments) if self.attachments else [self.attachment] if self.attachment else hikari.UNDEFINED
+        )
+        embeds: list[hikari.Embed] | hikari.UndefinedType = (
+            list(self.embeds) if self.embeds else [self.embed] if self.embed else hikari.UNDEFINED
+        )
 
         return hikari.impl.InteractionMessageBuilder(
             type=hikari.ResponseType.MESSAGE_CREATE,
             content=self.content,
             flags=self.flags,
-            components=components or ([self.component] if self.component else hikari.UNDEFINED),
-            attachments=attachments or ([self.attachment] if self.attachment else hikari.UNDEFINED),
-            embeds=embeds or ([self.embed] if self.embed else hikari.UNDEFINED),
+            components=components,
+            attachments=attachments,
+            embeds=embeds,
             mentions_everyone=self.mentions_everyone,
             user_mentions=self.user_mentions,
             role_mentions=self.role_mentions,
@@ -269,12 +261,12 @@ class Context(t.Generic[ClientT]):
         self._injection_ctx = alluka.OverridingContext.from_client(client.injector)
         self._interaction: hikari.CommandInteraction = interaction
         self._options: t.Sequence[hikari.CommandInteractionOption] | None = None
-        self._responses: t.MutableSequence[InteractionResponse] = []
+        self._responses: list[InteractionResponse] = []
         self._resp_builder: asyncio.Future[ResponseBuilderT] = asyncio.Future()
         self._issued_response: bool = False
         self._response_lock: asyncio.Lock = asyncio.Lock()
-        self._created_at = datetime.datetime.now()
-        self._autodefer_task: asyncio.Task[None] | None = None
+        self._created_at: float = time.monotonic()
+        self._autodefer_task: asyncio.TimerHandle | asyncio.Task[None] | None = None
         self._has_command_failed: bool = False
 
     @property
@@ -351,10 +343,8 @@ class Context(t.Generic[ClientT]):
         """Returns if the underlying interaction expired or not.
         This is not 100% accurate due to API latency, but should be good enough for most use cases.
         """
-        if self._issued_response:
-            return datetime.datetime.now() - self._created_at <= datetime.timedelta(minutes=15)
-        else:
-            return datetime.datetime.now() - self._created_at <= datetime.timedelta(seconds=3)
+        # Interaction tokens are valid for 15 minutes, but an initial response must be issued within 3 seconds
+        return time.monotonic() - self._created_at <= (900 if self._issued_response else 3)
 
     @property
     def issued_response(self) -> bool:
@@ -367,20 +357,26 @@ class Context(t.Generic[ClientT]):
         return self._has_command_failed
 
     def _start_autodefer(self, autodefer_mode: AutodeferMode) -> None:
-        """Start the autodefer task."""
+        """Schedule the autodefer task to be started after 2 seconds.
+
+        Most commands respond well within that time, in which case the timer is cancelled
+        and no task is ever created.
+        """
         if self._autodefer_task is not None:
             raise RuntimeError("Context autodefer task already started")
 
+        self._autodefer_task = asyncio.get_running_loop().call_later(2, self._spawn_autodefer, autodefer_mode)
+
+    def _spawn_autodefer(self, autodefer_mode: AutodeferMode) -> None:
+        """Start the autodefer task once the autodefer timer expired."""
         self._autodefer_task = asyncio.create_task(self._autodefer(autodefer_mode))
 
     async def _autodefer(self, autodefer_mode: AutodeferMode) -> None:
-        """Automatically defer the interaction after 2 seconds. This should be started as a task."""
-        await asyncio.sleep(2)
-
+        """Automatically defer the interaction. This should be started as a task once the autodefer timer expired."""
         async with self._response_lock:
             if self._issued_response:
                 return
-            logger.debug(f"Autodeferring an interaction for command '{self.command.name}'.")
+            logger.debug("Autodeferring an interaction for command '%s'.", self.command.name)
             flags = hikari.MessageFlag.EPHEMERAL if autodefer_mode is AutodeferMode.EPHEMERAL else hikari.UNDEFINED
             # ctx.defer() also acquires _response_lock so we need to use self._interaction directly
             if not self.client.is_rest:
@@ -399,15 +395,17 @@ class Context(t.Generic[ClientT]):
 
         If an autodefer task is running, it will be cancelled, unless cancel_autodefer is False.
         """
-        if self._autodefer_task is not None:
-            self._autodefer_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await self._autodefer_task
+        if (autodefer_task := self._autodefer_task) is not None:
+            autodefer_task.cancel()
+            # A pending timer handle is done once cancelled, only a running task needs to be awaited
+            if isinstance(autodefer_task, asyncio.Task):
+                with suppress(asyncio.CancelledError):
+                    await autodefer_task
             self._autodefer_task = None
 
         response = InteractionResponse(self, message)
         self._responses.append(response)
-        logger.debug(f"Created a new response for command '{self.command.name}'. Initial: {not bool(message)}")
+        logger.debug("Created a new response for command '%s'. Initial: %s", self.command.name, message is None)
         return response
 
     def get_guild(self) -> hikari.GatewayGuild | None:
@@ -486,7 +484,11 @@ class Context(t.Generic[ClientT]):
         if self._options is None:
             return None
 
-        value = next((x.value for x in self._options if x.name == name), None)
+        value = None
+        for option in self._options:
+            if option.name == name:
+                value = option.value
+                break
 
         if value is hikari.Snowflake and self._interaction.resolved is not None:
             value = resolve_snowflake_value(value, opt_type, self._interaction.resolved)
@@ -665,26 +667,37 @@ class Context(t.Generic[ClientT]):
                 )
                 response = await self._create_response(message)
             else:
-                glue = _ResponseGlue(
-                    content=content,
-                    flags=flags,
-                    tts=tts,
-                    component=component,
-                    components=components,
-                    attachment=attachment,
-                    attachments=attachments,
-                    embed=embed,
-                    embeds=embeds,
-                    mentions_everyone=mentions_everyone,
-                    user_mentions=user_mentions,
-                    role_mentions=role_mentions,
-                )
-
                 if not self.client.is_rest:
                     await self.interaction.create_initial_response(
-                        hikari.ResponseType.MESSAGE_CREATE, **glue._to_dict()
+                        hikari.ResponseType.MESSAGE_CREATE,
+                        content,
+                        flags=flags,
+                        tts=tts,
+                        component=component,
+                        components=components,
+                        attachment=attachment,
+                        attachments=attachments,
+                        embed=embed,
+                        embeds=embeds,
+                        mentions_everyone=mentions_everyone,
+                        user_mentions=user_mentions,
+                        role_mentions=role_mentions,
                     )
                 else:
+                    glue = _ResponseGlue(
+                        content=content,
+                        flags=flags,
+                        tts=tts,
+                        component=component,
+                        components=components,
+                        attachment=attachment,
+                        attachments=attachments,
+                        embed=embed,
+                        embeds=embeds,
+                        mentions_everyone=mentions_everyone,
+                        user_mentions=user_mentions,
+                        role_mentions=role_mentions,
+                    )
                     self._resp_builder.set_result(glue._to_builder())
 
                 self._issued_response = True
@@ -729,7 +742,7 @@ class Context(t.Generic[ClientT]):
                 self._issued_response = True
                 if not isinstance(builder, hikari.api.InteractionModalBuilder):
                     return await self._create_response()
-                logger.debug(f"Created a new response for command '{self.command.name}'. Initial: True")
+                logger.debug("Created a new response for command '%s'. Initial: True", self.command.name)
                 return
 
             if isinstance(builder, hikari.api.InteractionMessageBuilder):
@@ -770,7 +783,7 @@ class Context(t.Generic[ClientT]):
             self._issued_response = True
             if not isinstance(builder, hikari.api.InteractionModalBuilder):
                 return await self._create_response()
-            logger.debug(f"Created a new response for command '{self.command.name}'. Initial: True")
+            logger.debug("Created a new response for command '%s'. Initial: True", self.command.name)
 
     async def respond_with_modal(
         self, title: str, custom_id: str, *, components: t.Sequence[hikari.api.ComponentBuilder]
@@ -806,7 +819,7 @@ class Context(t.Generic[ClientT]):
                     title=title, custom_id=custom_id, components=list(components)
                 )
             self._issued_response = True
-            logger.debug(f"Created a new response for command '{self.command.name}'. Initial: True")
+            logger.debug("Created a new response for command '%s'. Initial: True", self.command.name)
 
     async def edit_initial_response(
         self,
@@ -27,6 +27,28 @@ OPTIONTYPE_TO_TYPE: dict[OptionType, type[t.Any]] = {
 }
 """Used for runtime type checking in Context.get_option, not much else at the moment."""
 
+SNOWFLAKE_RESOLVERS: dict[hikari.OptionType | int, t.Callable[[t.Any, hikari.ResolvedOptionData], t.Any]] = {
+    hikari.OptionType.USER: lambda value, resolved: resolved.members.get(value) or resolved.users[value],
+    hikari.OptionType.ATTACHMENT: lambda value, resolved: resolved.attachments[value],
+    hikari.OptionType.CHANNEL: lambda value, resolved: resolved.channels[value],
+    hikari.OptionType.ROLE: lambda value, resolved: resolved.roles[value],
+    hikari.OptionType.MENTIONABLE: lambda value, resolved: (
+        resolved.members.get(value) or resolved.users.get(value) or resolved.roles[value]
+    ),
+}
+"""Functions that look up the snowflake value of an option in the resolved data, keyed by option type."""
+
+RESOLVABLE_OPTION_TYPES: frozenset[hikari.OptionType | int] = frozenset(SNOWFLAKE_RESOLVERS)
+"""Option types whose values are snowflakes that need to be resolved."""
+
+OptionResolverT = t.Callable[
+    [t.Sequence[hikari.CommandInteractionOption], "hikari.ResolvedOptionData | None"], dict[str, t.Any]
+]
+"""A function that turns the options of an interaction into kwargs for the callback.
+
+The returned dict is always freshly created and owned by the caller, so it is safe to mutate.
+"""
+
 
 def resolve_snowflake_value(
     value: hikari.Snowflake, opt_type: hikari.OptionType | int, resolved: hikari.ResolvedOptionData
@@ -52,61 +74,94 @@ def resolve_snowflake_value(
     ValueError
         If the option type is not a valid option type.
     """
-    match opt_type:
-        case hikari.OptionType.USER:
-            out = resolved.members.get(value) or resolved.users[value]
-        case hikari.OptionType.ATTACHMENT:
-            out = resolved.attachments[value]
-        case hikari.OptionType.CHANNEL:
-            out = resolved.channels[value]
-        case hikari.OptionType.ROLE:
-            out = resolved.roles[value]
-        case hikari.OptionType.MENTIONABLE:
-            out = resolved.members.get(value) or resolved.users.get(value) or resolved.roles[value]
-        case _:
-            raise ValueError(f"Unexpected option type '{opt_type}.'")
-
-    return out
-
-
-def resolve_options(
-    local_options: t.MutableMapping[str, CommandOptionBase[ClientT, t.Any, t.Any]],
-    incoming_options: t.Sequence[hikari.CommandInteractionOption],
-    resolved: hikari.ResolvedOptionData | None,
-) -> dict[str, t.Any]:
-    """Resolve the options into kwargs for the callback.
+    if (resolver := SNOWFLAKE_RESOLVERS.get(opt_type)) is not None:
+        return resolver(value, resolved)
+
+    raise ValueError(f"Unexpected option type '{opt_type}.'")
+
+
+def needs_resolution(local_options: t.Mapping[str, CommandOptionBase[ClientT, t.Any, t.Any]]) -> bool:
+    """Check if any of the given options need to be resolved or converted before being passed to the callback.
 
     Parameters
     ----------
-    local_options : t.MutableMapping[str, Option[t.Any, t.Any]]
+    local_options : t.Mapping[str, Option[t.Any, t.Any]]
         The options of the locally stored command.
-    incoming_options : t.Sequence[hikari.CommandInteractionOption]
-        The options of the interaction.
-    resolved : hikari.ResolvedOptionData
-        The resolved option data of the interaction.
 
     Returns
     -------
-    dict[str, Any]
-        The resolved options as kwargs, ready to be passed to the callback.
+    bool
+        Whether the options need a full resolver instead of a plain name mapping.
+    """
+    return any(
+        isinstance(opt, ConverterOption) or opt.option_type.to_hikari() in RESOLVABLE_OPTION_TYPES
+        for opt in local_options.values()
+    )
+
+
+def make_option_resolver(local_options: t.Mapping[str, CommandOptionBase[ClientT, t.Any, t.Any]]) -> OptionResolverT:
+    """Create a resolver function specialized for the given options.
+
+    If none of the options need to be resolved or converted, the returned resolver
+    maps the incoming options directly onto their argument names, skipping all per-option type checks.
+
+    Parameters
+    ----------
+    local_options : t.Mapping[str, Option[t.Any, t.Any]]
+        The options of the locally stored command.
+
+    Returns
+    -------
+    OptionResolverT
+        A function that turns the options of an interaction into kwargs for the callback.
     """
-    option_kwargs: dict[str, t.Any] = {}
+    if needs_resolution(local_options):
+        # Keyed by the Discord-facing name, so the incoming options can be matched with a single lookup each
+        specs: dict[str, tuple[str, t.Callable[[t.Any], t.Any] | None]] = {
+            name: (
+                opt.arg_name,
+                t.cast(t.Callable[[t.Any], t.Any], opt._convert_value)  # pyright: ignore
+                if isinstance(opt, ConverterOption)
+                else None,
+            )
+            for name, opt in local_options.items()
+        }
+        resolvers = SNOWFLAKE_RESOLVERS
+
+        def resolver(
+            incoming_options: t.Sequence[hikari.CommandInteractionOption], resolved: hikari.ResolvedOptionData | None
+        ) -> dict[str, t.Any]:
+            option_kwargs: dict[str, t.Any] = {}
+
+            for inter_opt in incoming_options:
+                spec = specs.get(inter_opt.name)
+
+                if spec is None:
+                    continue
+
+                arg_name, convert = spec
+                value = inter_opt.value
+
+                if (resolve := resolvers.get(inter_opt.type)) is not None:
+                    if not resolved:
+                        raise ValueError(f"Missing resolved option data for '{inter_opt.name}'.")
+
+                    value = resolve(value, resolved)
+
+                if convert is not None:
+                    value = convert(value)
 
-    for opt in local_options.values():
-        inter_opt = next((o for o in incoming_options if o.name == opt.name), None)
+                option_kwargs[arg_name] = value
 
-        if inter_opt is None:
-            continue
+            return option_kwargs
 
-        if isinstance(inter_opt.value, hikari.Snowflake) and resolved:
-            option_kwargs[opt.arg_name] = resolve_snowflake_value(inter_opt.value, inter_opt.type, resolved)
+        return resolver
 
-        elif isinstance(inter_opt.value, hikari.Snowflake):
-            raise ValueError(f"Missing resolved option data for '{inter_opt.name}'.")
-        else:
-            option_kwargs[opt.arg_name] = inter_opt.value
+    arg_names = {name: opt.arg_name for name, opt in local_options.items()}
 
-        if isinstance(opt, ConverterOption):
-            option_kwargs[opt.arg_name] = opt._convert_value(option_kwargs[opt.arg_name])  # pyright: ignore
+    def primitive_resolver(
+        incoming_options: t.Sequence[hikari.CommandInteractionOption], resolved: hikari.ResolvedOptionData | None
+    ) -> dict[str, t.Any]:
+        return {arg_names[o.name]: o.value for o in incoming_options if o.name in arg_names}
 
-    return option_kwargs
+    return primitive_resolver
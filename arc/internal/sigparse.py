@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import inspect
 import sys
 import types
@@ -118,8 +119,12 @@ def _get_all_channel_types() -> dict[type[hikari.PartialChannel], set[hikari.Cha
 CHANNEL_TYPES_MAPPING = _get_all_channel_types()
 
 
+@functools.lru_cache(maxsize=None)
 def _get_option_type(hint: t.Any) -> type[CommandOptionBase[t.Any, t.Any, t.Any]] | None:
-    """Get the option type from a type hint."""
+    """Get the option type from a type hint.
+
+    The result only depends on the hint, so it is cached, as the same few hints are used across most commands.
+    """
     if _is_mentionable_union(hint):
         return MentionableOption  # pyright: ignore reportGeneralTypeIssues
 
@@ -6,7 +6,7 @@ if t.TYPE_CHECKING:
     import alluka
     import hikari
 
-    from arc.abc import Client, Hookable, HookResult, OptionParams
+    from arc.abc import Client, CommandOptionBase, Hookable, HookResult, OptionParams
     from arc.abc.concurrency_limiting import HasConcurrencyLimiter
     from arc.client import GatewayClientBase, RESTClientBase
     from arc.command import SlashCommand, SlashGroup
@@ -27,6 +27,10 @@ BuilderT = t.TypeVar("BuilderT", bound="hikari.api.SlashCommandBuilder | hikari.
 ParamsT = t.TypeVar("ParamsT", bound="OptionParams[t.Any]")
 HookableT = t.TypeVar("HookableT", bound="Hookable[t.Any]")
 HasConcurrencyLimiterT = t.TypeVar("HasConcurrencyLimiterT", bound="HasConcurrencyLimiter[t.Any]")
+OptionT = t.TypeVar("OptionT", bound="CommandOptionBase[t.Any, t.Any, t.Any]")
+InteractionOptionT = t.TypeVar(
+    "InteractionOptionT", "hikari.CommandInteractionOption", "hikari.AutocompleteInteractionOption"
+)
 
 # Type aliases
 EventCallbackT: t.TypeAlias = "t.Callable[[EventT], t.Awaitable[None]]"
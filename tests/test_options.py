@@ -5,6 +5,7 @@ import hikari
 import pytest
 import typing_extensions as te
 
+import arc
 from arc.abc.option import OptionType
 from arc.context import Context
 from arc.internal.options import OPTIONTYPE_TO_TYPE
@@ -51,3 +52,18 @@ def test_options_mapping_contains_all_options() -> None:
             continue
 
         assert option_type in OPTIONTYPE_TO_TYPE, f"Missing {option_type!r} in OPTIONTYPE_TO_TYPE mapping."
+
+
+def test_command_option_reflects_modifications() -> None:
+    option = arc.command.IntOption[arc.GatewayClient](name="foo", arg_name="foo", description="bar")
+    assert option.to_command_option().choices is None
+
+    option.description = "baz"
+    choices = [1, 2]
+    option.choices = choices
+    choices.append(3)
+
+    command_option = option.to_command_option()
+    assert command_option.description == "baz"
+    assert command_option.choices is not None
+    assert [choice.value for choice in command_option.choices] == [1, 2, 3]
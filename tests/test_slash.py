@@ -1,4 +1,8 @@
+import typing as t
+from unittest import mock
+
 import hikari
+import pytest
 
 import arc
 
@@ -158,3 +162,127 @@ def test_my_group() -> None:
 
     subsubcmd = subgroup.children["test_subsubcommand"]
     assert subsubcmd.qualified_name == ("my_group", "my_subgroup", "test_subsubcommand")
+
+
+def test_group_payload_reflects_modified_children() -> None:
+    group = arc.SlashGroup[arc.GatewayClient](name="payload_group", description="Payload group")
+
+    @group.include
+    @arc.slash_subcommand("child", "Old description")
+    async def child(ctx: arc.GatewayContext) -> None:
+        pass
+
+    assert group._to_dict()["options"][0].description == "Old description"
+
+    child.description = "New description"
+    assert group._to_dict()["options"][0].description == "New description"
+    assert group._build().options[0].description == "New description"
+
+
+def test_options_are_read_only() -> None:
+    command = client._slash_commands["test"]
+    group = client._slash_commands["my_group"]
+    assert isinstance(command, arc.SlashCommand)
+    assert isinstance(group, arc.SlashGroup)
+    subcmd = group.children["test_subcommand"]
+    assert isinstance(subcmd, arc.SlashSubCommand)
+
+    option = arc.command.IntOption[arc.GatewayClient](name="new", description="new", arg_name="new")
+
+    with pytest.raises(TypeError):
+        t.cast("dict[str, t.Any]", command.options)["new"] = option
+    with pytest.raises(TypeError):
+        t.cast("dict[str, t.Any]", subcmd.options)["new"] = option
+
+    assert "new" not in command.options
+    assert "new" not in subcmd.options
+
+
+def test_choices_to_builders() -> None:
+    from arc.command.slash import _choices_to_builders
+
+    builders = [hikari.impl.AutocompleteChoiceBuilder("a", "a"), hikari.impl.AutocompleteChoiceBuilder("b", "b")]
+    assert _choices_to_builders(builders) is builders
+    assert _choices_to_builders(tuple(builders)) == builders
+    assert _choices_to_builders([]) == []
+
+    converted = _choices_to_builders([1, 2])
+    assert [(c.name, c.value) for c in converted] == [("1", 1), ("2", 2)]
+
+    converted = _choices_to_builders({"one": 1})
+    assert [(c.name, c.value) for c in converted] == [("one", 1)]
+
+
+def test_find_child_option() -> None:
+    from arc.command.slash import _find_child_option
+
+    def option(name: str) -> hikari.CommandInteractionOption:
+        return hikari.CommandInteractionOption(name=name, type=hikari.OptionType.SUB_COMMAND, value=None, options=None)
+
+    children = group.children
+    sub, other = option("test_subcommand"), option("unknown")
+
+    assert _find_child_option([sub], children) is sub
+    assert _find_child_option([other, sub], children) is sub
+    assert _find_child_option([other], children) is None
+    assert _find_child_option([], children) is None
+
+
+def test_request_command_locale() -> None:
+    locale_client = arc.GatewayClient(bot, provided_locales=[hikari.Locale.DE, hikari.Locale.FR])
+
+    requests: list[arc.CommandLocaleRequest] = []
+
+    @locale_client.set_command_locale_provider
+    def provider(request: arc.CommandLocaleRequest) -> arc.LocaleResponse:
+        requests.append(request)
+        if request.locale is hikari.Locale.FR:
+            return arc.LocaleResponse(name=f"{request.name}_fr")
+        return arc.LocaleResponse(name=f"{request.name}_de", description="Beschreibung")
+
+    @locale_client.include
+    @arc.slash_command("localized", "Localized command")
+    async def localized(ctx: arc.GatewayContext) -> None:
+        pass
+
+    assert isinstance(localized, arc.SlashCommand)
+    localized._request_command_locale()
+
+    # Locales without both a name and a description are skipped for slash commands
+    assert localized.name_localizations == {hikari.Locale.DE: "localized_de"}
+    assert localized.description_localizations == {hikari.Locale.DE: "Beschreibung"}
+
+    # Localizations are only requested once, even if the command is synced again
+    localized._request_command_locale()
+    assert len(requests) == 2
+
+
+def test_slash_commands_are_slotted() -> None:
+    # Any base class without __slots__ (e.g. a protocol) would silently add a __dict__ to every command
+    assert not hasattr(my_command, "__dict__")
+    assert not hasattr(my_subcommand, "__dict__")
+
+
+def test_autocomplete_data_focused_option() -> None:
+    def option(name: str, value: str, is_focused: bool) -> hikari.AutocompleteInteractionOption:
+        return hikari.AutocompleteInteractionOption(
+            name=name, type=hikari.OptionType.STRING, value=value, options=None, is_focused=is_focused
+        )
+
+    options = [option("a", "foo", False), option("b", "ba", True)]
+
+    interaction = mock.Mock(spec=hikari.AutocompleteInteraction)
+
+    data = arc.AutocompleteData[arc.GatewayClient, str](
+        client=client, command=my_command, interaction=interaction, options=options
+    )
+    assert not hasattr(data, "__dict__")
+    assert data.focused_option is options[1]
+    assert data.focused_value == "ba"
+
+    # An option already found while routing the interaction is used without scanning the options
+    data = arc.AutocompleteData[arc.GatewayClient, str](
+        client=client, command=my_command, interaction=interaction, options=[]
+    )
+    data._focused_option = options[1]
+    assert data.focused_option is options[1]